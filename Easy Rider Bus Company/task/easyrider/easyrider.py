@@ -1,29 +1,60 @@
 import json
 import re
+import sys
 from collections import defaultdict
-from dataclasses import dataclass
-from typing import Dict, List
+from typing import Dict, Iterable, List, Tuple
+
+# the compiled regex beats any hand-written scanner in pure Python, keep it
+_STOP_NAME_RE = re.compile(r'^[A-Z][a-z]+(?: [A-Z][a-z]+)* (?:Road|Avenue|Boulevard|Street)$')
+_match_stop_name = _STOP_NAME_RE.match
+_STOP_NAME_SUFFIXES = (' Road', ' Avenue', ' Boulevard', ' Street')
+_VALID_STOP_TYPES = frozenset(('S', 'O', 'F', ''))
+
+
+def _error_counter(index: int) -> property:
+    """Expose a single slot of ValidationResult.c as a named attribute."""
+
+    def getter(self) -> int:
+        return self.c[index]
+
+    def setter(self, value: int) -> None:
+        self.c[index] = value
+
+    return property(getter, setter)
 
 
-@dataclass
 class ValidationResult:
-    bus_id_errors: int = 0
-    stop_id_errors: int = 0
-    stop_name_errors: int = 0
-    next_stop_errors: int = 0
-    stop_type_errors: int = 0
-    a_time_errors: int = 0
+    """Error counts per field.
+
+    Counts are kept in the list `c` (in order: bus_id, stop_id, stop_name,
+    next_stop, stop_type, a_time), so hot loops can update them by index.
+    Named attributes are available for the rest of the code.
+    """
+
+    bus_id_errors = _error_counter(0)
+    stop_id_errors = _error_counter(1)
+    stop_name_errors = _error_counter(2)
+    next_stop_errors = _error_counter(3)
+    stop_type_errors = _error_counter(4)
+    a_time_errors = _error_counter(5)
+
+    def __init__(self):
+        self.c: List[int] = [0] * 6
+
+    def __eq__(self, other):
+        if not isinstance(other, ValidationResult):
+            return NotImplemented
+        return self.c == other.c
 
     def __repr__(self):
-        total_errors = (self.bus_id_errors + self.stop_id_errors + self.stop_name_errors +
-                        self.next_stop_errors + self.stop_type_errors + self.a_time_errors)
-        return (f'Type and field validation: {total_errors} errors\n'
-                f'bus_id: {self.bus_id_errors}\n'
-                f'stop_id: {self.stop_id_errors}\n'
-                f'stop_name: {self.stop_name_errors}\n'
-                f'next_stop: {self.next_stop_errors}\n'
-                f'stop_type: {self.stop_type_errors}\n'
-                f'a_time: {self.a_time_errors}')
+        c = self.c
+        return (f'Type and field validation: {sum(c)} errors\n'
+                f'bus_id: {c[0]}\n'
+                f'stop_id: {c[1]}\n'
+                f'stop_name: {c[2]}\n'
+                f'next_stop: {c[3]}\n'
+                f'stop_type: {c[4]}\n'
+                f'a_time: {c[5]}')
 
 
 class BusLine:
@@ -36,6 +67,18 @@ class BusLine:
     def __init__(self, line_id: int):
         self.line_id = line_id  # corresponds to bus_id
         self.stops: List[BusStop] = []
+        # start and finish stops are counted as stops are added
+        self._start_count = 0
+        self._finish_count = 0
+
+    def add_stop(self, stop: 'BusStop') -> None:
+        """Add a stop to the line, keeping start and finish stop counts up to date."""
+        stop_type = stop.stop_type
+        if stop_type == 'S':
+            self._start_count += 1
+        elif stop_type == 'F':
+            self._finish_count += 1
+        self.stops.append(stop)
 
     def get_number_of_stops(self) -> int:
         """Return the number of stops in the bus line."""
@@ -44,15 +87,16 @@ class BusLine:
     def is_line_valid(self) -> bool:
         """Check if the bus line is valid based on its stops.
         Line is valid if it has exactly one start stop ('S') and one finish stop ('F').
+        Relies on stops being added with add_stop.
         """
-        start_stops = sum(1 for s in self.stops if s.stop_type == 'S')
-        finish_stops = sum(1 for s in self.stops if s.stop_type == 'F')
-        return start_stops == 1 and finish_stops == 1
+        return self._start_count == 1 and self._finish_count == 1
 
 
 class BusStop:
     """A bus stop with specific attributes."""
 
+    __slots__ = ('bus_id', 'stop_id', 'stop_name', 'next_stop', 'stop_type', 'a_time')
+
     def __init__(self, bus_id: int, stop_id: int, stop_name: str, next_stop: int,
                  stop_type: str, a_time: str):
         self.bus_id = bus_id
@@ -70,32 +114,42 @@ class BusCompany:
     Holds a collection of BusLine objects.
     """
 
-    def __init__(self, data: List[Dict]):
+    def __init__(self, data: Iterable[Dict] = ()):
+        """Create bus lines from input data, more items can be added with add_item.
+
+        :param data: List of input data dictionaries
+        """
         self.bus_lines: List[BusLine] = []
-        self.data = data
+        self._lines_by_id: Dict[int, BusLine] = {}  # index of bus_lines by line_id
 
         for item in data:
-            stop = BusStop(
-                bus_id=item.get('bus_id'),
-                stop_id=item.get('stop_id'),
-                stop_name=item.get('stop_name'),
-                next_stop=item.get('next_stop'),
-                stop_type=item.get('stop_type'),
-                a_time=item.get('a_time')
-            )
-            line = self._get_or_create_line(stop)
-            line.stops.append(stop)
+            self.add_item(item)
+
+    def add_item(self, item: Dict) -> None:
+        """Create a BusStop from an input item and add it to its bus line."""
+        stop = BusStop(
+            bus_id=item.get('bus_id'),
+            stop_id=item.get('stop_id'),
+            stop_name=item.get('stop_name'),
+            next_stop=item.get('next_stop'),
+            stop_type=item.get('stop_type'),
+            a_time=item.get('a_time')
+        )
+        self._get_or_create_line(stop).add_stop(stop)
 
     def _get_or_create_line(self, stop: BusStop) -> BusLine:
         """Get existing BusLine by bus_id or create a new one."""
-        # check if line already in bus_lines
-        for line in self.bus_lines:
-            if line.stops and line.line_id == stop.bus_id:
-                return line
-        # create new line and add to bus lines tracked by bus company
-        new_line = BusLine(stop.bus_id)
-        self.bus_lines.append(new_line)
-        return new_line
+        line = self._lines_by_id.get(stop.bus_id)
+        if line is None:
+            # create new line and add to bus lines tracked by bus company
+            line = BusLine(stop.bus_id)
+            self._lines_by_id[stop.bus_id] = line
+            self.bus_lines.append(line)
+        return line
+
+    def count_stops(self) -> Dict[int, int]:
+        """Return the number of stops for each bus_id."""
+        return {line.line_id: line.get_number_of_stops() for line in self.bus_lines}
 
     def print_line_info(self):
         for line in self.bus_lines:
@@ -108,26 +162,23 @@ class BusCompany:
     def print_stops_info(self):
         start_stops = set()
         finish_stops = set()
-        transfer_stops = set()
         on_demand_stops = set()
+        stop_count = defaultdict(int)
 
         for line in self.bus_lines:
             for stop in line.stops:
-                if stop.stop_type == 'S':
-                    start_stops.add(stop.stop_name)
-                elif stop.stop_type == 'F':
-                    finish_stops.add(stop.stop_name)
-                elif stop.stop_type == 'O':
-                    on_demand_stops.add(stop.stop_name)
+                stop_name = stop.stop_name
+                stop_type = stop.stop_type
+                stop_count[stop_name] += 1
+                if stop_type == 'S':
+                    start_stops.add(stop_name)
+                elif stop_type == 'F':
+                    finish_stops.add(stop_name)
+                elif stop_type == 'O':
+                    on_demand_stops.add(stop_name)
 
         # middle stop is shared by at least two lines
-        stop_count = defaultdict(int)
-        for line in self.bus_lines:
-            for stop in line.stops:
-                stop_count[stop.stop_name] += 1
-        for stop_name, count in stop_count.items():
-            if count > 1:
-                transfer_stops.add(stop_name)
+        transfer_stops = {stop_name for stop_name, count in stop_count.items() if count > 1}
 
         print(f'Start stops: {len(start_stops)} {sorted(start_stops)}')
         print(f'Transfer stops: {len(transfer_stops)} {sorted(transfer_stops)}')
@@ -151,89 +202,94 @@ def validate_item(item: Dict, result: ValidationResult) -> None:
     :param result: The ValidationResult object to update
     """
 
-    if not isinstance(item.get('bus_id'), int):
-        result.bus_id_errors += 1
+    c = result.c
+    get = item.get
+    bus_id = get('bus_id')
+    stop_id = get('stop_id')
+    stop_name = get('stop_name')
+    next_stop = get('next_stop')
+    stop_type = get('stop_type')
+    a_time = get('a_time')
 
-    if not isinstance(item.get('stop_id'), int):
-        result.stop_id_errors += 1
+    if not isinstance(bus_id, int):
+        c[0] += 1
 
-    stop_name = item.get('stop_name')
+    if not isinstance(stop_id, int):
+        c[1] += 1
+
+    # cheap checks first, most invalid names never reach the regex;
+    # '$' also matches before a trailing newline, so the suffix check ignores it
     if not (isinstance(stop_name, str) and stop_name
-            and re.match(r'^[A-Z][a-z]+(?: [A-Z][a-z]+)* (Road|Avenue|Boulevard|Street)$', stop_name)):
-        result.stop_name_errors += 1
+            and stop_name[0].isupper() and stop_name.rstrip('\n').endswith(_STOP_NAME_SUFFIXES)
+            and _match_stop_name(stop_name)):
+        c[2] += 1
+
+    if not isinstance(next_stop, int):
+        c[3] += 1
+
+    # set lookup hashes its operand, so rule out non-strings (e.g. a JSON list) first
+    if not isinstance(stop_type, str) or stop_type not in _VALID_STOP_TYPES:
+        c[4] += 1
+
+    if not (isinstance(a_time, str) and len(a_time) == 5 and a_time[2] == ':'):
+        c[5] += 1
+    else:
+        # digit values taken straight from code points, no slicing or int() parsing
+        h1 = ord(a_time[0]) - 48
+        h2 = ord(a_time[1]) - 48
+        m1 = ord(a_time[3]) - 48
+        m2 = ord(a_time[4]) - 48
+        # OR-ing the values keeps them all in 0..15 only if none went negative or past 15;
+        # what is left to check is the 10..15 range and the hour/minute bounds
+        if ((h1 | h2 | m1 | m2) & ~15 or h2 > 9 or m2 > 9
+                or m1 > 5 or h1 * 10 + h2 >= 24):
+            c[5] += 1
 
-    if not isinstance(item.get('next_stop'), int):
-        result.next_stop_errors += 1
 
-    stop_type = item.get('stop_type')
-    if stop_type not in ('S', 'O', 'F', ''):
-        result.stop_type_errors += 1
+def print_bus_stops(bus_stops: Dict[int, int]) -> None:
+    """ Print the number of stops for each bus_id.
 
-    a_time = item.get('a_time')
-    if not (isinstance(a_time, str) and len(a_time) == 5 and
-            a_time[2] == ':' and
-            a_time[:2].isdigit() and 0 <= int(a_time[:2]) < 24 and
-            a_time[3:].isdigit() and 0 <= int(a_time[3:]) < 60):
-        result.a_time_errors += 1
+    :param bus_stops: Dictionary of bus stop counts
+    """
+    print('Line names and number of stops:')
+    for bus_id, stops in sorted(bus_stops.items()):
+        print(f'Bus {bus_id}: stops: {stops}')
 
 
-def validate_data(data: List[Dict]) -> ValidationResult:
-    """Validate the input data and return the validation results.
+def build_and_validate(data: List[Dict]) -> Tuple[BusCompany, ValidationResult, Dict[int, int]]:
+    """Build the bus company, validate items and count stops in a single pass over data.
 
     :param data: List of input data dictionaries
-    :return: ValidationResult object containing error counts
+    :return: BusCompany, ValidationResult and dictionary of bus stop counts
     """
+    bus_company = BusCompany()
     result = ValidationResult()
 
     for item in data:
         validate_item(item, result)
+        bus_company.add_item(item)
 
-    return result
-
-
-def count_bus_stops(data: List[Dict]) -> Dict[int, int]:
-    """ Count the number of stops for each bus_id.
-
-    :param data: List of data from input
-    :return: Dictionary of bus stop counts
-    """
-
-    bus_stops = defaultdict(int)
-
-    for item in data:
-        bus_id = item.get('bus_id')
-        bus_stops[bus_id] += 1
-    return bus_stops
-
-
-def print_bus_stops(bus_stops: Dict[int, int]) -> None:
-    """ Print the number of stops for each bus_id.
-
-    :param bus_stops: Dictionary of bus stop counts
-    """
-    print('Line names and number of stops:')
-    for bus_id in sorted(bus_stops.keys()):
-        print(f'Bus {bus_id}: stops: {bus_stops[bus_id]}')
+    # lines are already grouped by bus_id, no need for a separate counting dict
+    return bus_company, result, bus_company.count_stops()
 
 
 def a_time_to_minutes(a_time: str) -> int:
     """Convert a_time in 'HH:MM' format to total minutes since midnight."""
-    hours, minutes = map(int, a_time.split(':'))
-    return hours * 60 + minutes
+    hours, _, minutes = a_time.partition(':')
+    return int(hours) * 60 + int(minutes)
 
 
 def main():
-    data = json.loads(input())
-    bus_company = BusCompany(data)
+    # decode straight from the raw stdin bytes, skipping the intermediate str
+    data = json.loads(sys.stdin.buffer.read())
+    bus_company, validation_result, bus_stops_count = build_and_validate(data)
 
     # data validation
-    validation_result = validate_data(data)
     validate_bus_arrival_times(bus_company, validation_result)
 
     print(validation_result)
     print()
 
-    bus_stops_count = count_bus_stops(data)
     print_bus_stops(bus_stops_count)
     print()
 
@@ -252,19 +308,26 @@ def validate_bus_arrival_times(bus_company: BusCompany, validation_result: Valid
     Use ValidationResult to track number of errors found
     """
 
+    counts = validation_result.c
+    # a start stop's a_time is kept raw and parsed only once a later stop is compared to it;
+    # as before, previous carries over into a following line that has no start stop
+    previous = -1
+
     for line in bus_company.bus_lines:
         for stop in line.stops:
             if stop.stop_type == 'S':
-                previous_time = stop.a_time
+                previous = stop.a_time
             else:
-                current_time = stop.a_time
+                current = a_time_to_minutes(stop.a_time)
+                if isinstance(previous, str):
+                    previous = a_time_to_minutes(previous)
                 # checking if consecutive stops have increasing a_time
-                if a_time_to_minutes(current_time) < a_time_to_minutes(previous_time):
-                    validation_result.a_time_errors += 1
+                if current < previous:
+                    counts[5] += 1
                     # stop checking that line on first error found
                     break
 
-                previous_time = current_time
+                previous = current
 
 
 if __name__ == '__main__':